@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pytest
@@ -31,6 +35,37 @@ def test_parse_args_uses_custom_paths() -> None:
     assert args.txt_path == Path("out")
 
 
+def test_parse_args_accepts_worker_count() -> None:
+    """CLI parser should accept a --workers value."""
+    args = extract_pdf_text.parse_args(["--workers", "2"])
+
+    assert args.workers == 2
+
+
+def test_parse_args_rejects_non_positive_worker_count() -> None:
+    """CLI parser should reject a --workers value below 1."""
+    with pytest.raises(SystemExit):
+        extract_pdf_text.parse_args(["--workers", "0"])
+
+
+def test_resolve_worker_count_caps_at_file_count() -> None:
+    """No more workers than PDFs should be started."""
+    assert extract_pdf_text.resolve_worker_count(8, 3) == 3
+    assert extract_pdf_text.resolve_worker_count(None, 1) == 1
+
+
+def test_resolve_worker_count_clamps_on_windows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Windows process pools cannot exceed MAX_WINDOWS_WORKERS."""
+    monkeypatch.setattr(extract_pdf_text.sys, "platform", "win32")
+
+    assert (
+        extract_pdf_text.resolve_worker_count(100, 500)
+        == extract_pdf_text.MAX_WINDOWS_WORKERS
+    )
+
+
 def test_clean_non_latin_chars_removes_unsupported_symbols() -> None:
     """Unsupported symbols should be removed while preserving useful text."""
     cleaned = extract_pdf_text.clean_non_latin_chars("Alpha β test @email.com ✓")
@@ -38,6 +73,29 @@ def test_clean_non_latin_chars_removes_unsupported_symbols() -> None:
     assert cleaned == "Alpha β test @email.com"
 
 
+def test_clean_non_latin_chars_handles_ascii_only_text() -> None:
+    """ASCII-only text should be filtered the same way as Unicode text."""
+    cleaned = extract_pdf_text.clean_non_latin_chars("a^b `quoted`  x_y\tend")
+
+    assert cleaned == "a b quoted x_y end"
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("exam-\nple text", "example text"),
+        ("exam-  \nple text", "example text"),
+        ("x-\ny-  \nz", "xyz"),
+        ("end of page\n 12", "end of page"),
+        ("items:\n • first", "items: • first"),
+        ("camelCase words", "camel Case words"),
+    ],
+)
+def test_clean_text_fixes_common_artifacts(text: str, expected: str) -> None:
+    """Hyphenation, page numbers, bullets, and merged words should be cleaned."""
+    assert extract_pdf_text.clean_text(text) == expected
+
+
 def test_process_pdf_directory_raises_for_missing_path(tmp_path: Path) -> None:
     """Missing PDF directories should raise a clear error."""
     missing_dir = tmp_path / "does-not-exist"
@@ -46,6 +104,52 @@ def test_process_pdf_directory_raises_for_missing_path(tmp_path: Path) -> None:
         extract_pdf_text.process_pdf_directory(missing_dir, tmp_path / "out")
 
 
+def test_process_pdf_directory_counts_unreadable_pdfs(tmp_path: Path) -> None:
+    """A PDF that cannot be parsed should be reported as a failure."""
+    pdf_dir = tmp_path / "pdf"
+    pdf_dir.mkdir()
+    (pdf_dir / "broken.pdf").write_bytes(b"not a pdf")
+
+    success_count, error_count = extract_pdf_text.process_pdf_directory(
+        pdf_dir, tmp_path / "out", workers=1
+    )
+
+    assert (success_count, error_count) == (0, 1)
+
+
+def _exit_on_crash_pdf(pdf_path: Path, output_dir: Path) -> Path:
+    """Stand-in for ``process_pdf`` that kills the worker for a_crash.pdf."""
+    if pdf_path.name == "a_crash.pdf":
+        os._exit(139)
+    return output_dir / f"{pdf_path.stem}.txt"
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="requires the fork start method to patch worker code",
+)
+def test_process_pdf_directory_reports_crashed_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A worker that exits abruptly should be reported instead of hanging."""
+    pdf_dir = tmp_path / "pdf"
+    pdf_dir.mkdir()
+    (pdf_dir / "a_crash.pdf").write_bytes(b"")
+    (pdf_dir / "b_ok.pdf").write_bytes(b"")
+    monkeypatch.setattr(extract_pdf_text, "process_pdf", _exit_on_crash_pdf)
+    monkeypatch.setattr(
+        extract_pdf_text,
+        "ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("fork")),
+    )
+
+    success_count, error_count = extract_pdf_text.process_pdf_directory(
+        pdf_dir, tmp_path / "out", workers=1
+    )
+
+    assert (success_count, error_count) == (0, 2)
+
+
 def test_examples_match_expected_output(
     sample_paths: tuple[Path, Path], output_dir: Path
 ) -> None: